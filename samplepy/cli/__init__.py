@@ -2,6 +2,12 @@
 Command Line Interface components for SamplePy
 """
 
-from .tui_minimal import run_minimal_tui
+__all__ = ["run_minimal_tui"]
 
-__all__ = ["run_minimal_tui"] 
\ No newline at end of file
+
+def __getattr__(name):
+    # Textual is slow to import, so only load the TUI when it is asked for
+    if name == "run_minimal_tui":
+        from .tui_minimal import run_minimal_tui
+        return run_minimal_tui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
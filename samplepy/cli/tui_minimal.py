@@ -3,20 +3,43 @@ Minimal Text User Interface (TUI) for SamplePy
 Simple, clean implementation focusing on core functionality
 """
 
+import asyncio
+import heapq
+import itertools
+import os
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Callable
+from typing import Optional, List, Dict, Tuple, Callable
 
 from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.widgets import Header, Footer, Tree, Label, Input
-from textual.widgets.tree import TreeNode
+from textual.widgets.tree import TreeNode, UnknownNodeID
 from textual.message import Message
 from textual.binding import Binding
 from textual.events import Key
+from textual.timer import Timer
+from textual.worker import Worker, get_current_worker
 
 from samplepy.core.file_utils import FileUtils
 
+# Number of tree nodes added before yielding back to the event loop
+_POPULATE_BATCH = 200
+# Directories bigger than this only sort and show one page of entries at a time
+_LARGE_DIR_THRESHOLD = 1000
+# Folder levels below the root to scan ahead of time, and the most entries to read doing so
+_PRELOAD_DEPTH = 2
+_PRELOAD_BUDGET = 5000
+
+_DIR_PREFIX = "📁 "
+_FILE_PREFIX = "📄 "
+
+
+def _sort_key(entry: os.DirEntry) -> Tuple[bool, str]:
+    """Folders first, then files, case-insensitively by name."""
+    return (not entry.is_dir(), entry.name.lower())
+
 
 class FileTree(Tree[Path]):
     """Tree widget for displaying file system hierarchy"""
@@ -24,47 +47,323 @@ class FileTree(Tree[Path]):
     def __init__(self, path: Path, **kwargs):
         super().__init__(path.name or str(path), data=path, **kwargs)
         self.root_path = path
-
-    def reload(self, new_path: Optional[Path] = None) -> None:
-        """Reload the tree view from the specified path or the current root."""
+        # Directory listings keyed by path, reused while st_mtime_ns is unchanged,
+        # with whether the listing is already in display order
+        self._dir_cache: Dict[Path, Tuple[int, List[os.DirEntry], bool]] = {}
+        # Loaded nodes by path, kept in step with add/remove
+        self._path_index: Dict[Path, TreeNode[Path]] = {path: self.root}
+        # Entries shown so far in large directories, and their "… N more" nodes
+        self._visible_limits: Dict[Path, int] = {}
+        self._more_nodes: Dict[TreeNode[Path], TreeNode[Path]] = {}
+
+    def reload(self, new_path: Optional[Path] = None, rescan: bool = False) -> None:
+        """Reload the tree view from the specified path or the current root.
+
+        With rescan=True every cached listing is dropped, so changes the
+        mtime check can't see (coarse timestamps on FAT, SMB, ...) show up.
+        """
+        self.workers.cancel_node(self)
         if new_path:
             self.root_path = new_path
             self.root.data = new_path
             self.root.label = new_path.name or str(new_path)
+            self._prune_caches(new_path)
+        if rescan:
+            self._dir_cache = {}
 
         self.clear()
+        self._path_index = {self.root_path: self.root}
+        self._more_nodes = {}
         self._populate_node(self.root)
+        self._start_preload()
+
+    def get_node_for_path(self, path: Path) -> Optional[TreeNode[Path]]:
+        """Return the loaded node for a path, or None if it isn't in the tree."""
+        return self._path_index.get(path)
+
+    def refresh_dir(self, path: Path) -> None:
+        """Rescan one loaded directory in place, leaving the rest of the tree alone."""
+        self.invalidate(path)
+        node = self.get_node_for_path(path)
+        if node is None or not (node.is_root or node.is_expanded):
+            # Not showing its children; they'll be scanned on the next expand
+            return
+        self._unindex_children(node)
+        node.remove_children()
+        self._populate_node_unchecked(node)
+
+    def remove_path(self, path: Path) -> None:
+        """Drop the node for a path that no longer exists."""
+        self.invalidate(path.parent)
+        node = self.get_node_for_path(path)
+        if node is None:
+            return
+        if node.is_root:
+            self.reload()
+            return
+        del self._path_index[path]
+        self._unindex_children(node)
+        node.remove()
+
+    def _unindex_children(self, node: TreeNode[Path]) -> None:
+        """Forget the index entries for every descendant of a node."""
+        for child in node.children:
+            if child.data is not None:
+                self._path_index.pop(child.data, None)
+            else:
+                self._more_nodes.pop(child, None)
+            self._unindex_children(child)
+
+    def _prune_caches(self, root: Path) -> None:
+        """Forget listings and page sizes for directories outside root."""
+        prefix = os.path.join(root, "")
+
+        def inside(path: Path) -> bool:
+            return path == root or str(path).startswith(prefix)
+
+        self._dir_cache = {p: v for p, v in self._dir_cache.items() if inside(p)}
+        self._visible_limits = {p: v for p, v in self._visible_limits.items() if inside(p)}
+
+    def invalidate(self, path: Path) -> None:
+        """Drop the cached listing for a directory so the next scan hits the disk."""
+        self._dir_cache.pop(path, None)
+
+    def _scan_dir(self, path: Path, max_entries: Optional[int] = None,
+                  store: Optional[Dict] = None) -> Optional[List[os.DirEntry]]:
+        """Return the entries of a directory, rescanning only if it changed.
+
+        Listings up to _LARGE_DIR_THRESHOLD entries come back sorted; larger
+        ones are left unsorted so only the visible page needs ordering, until
+        _show_more sorts them once in the cache.
+        With max_entries, reading stops early and None is returned (nothing is
+        cached) if the directory holds more than that. A fresh listing goes
+        into store instead of the cache when one is given.
+        """
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self._dir_cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            if max_entries is not None and len(cached[1]) > max_entries:
+                return None
+            return cached[1]
+
+        # DirEntry answers is_dir() from the d_type readdir already returned,
+        # so only symlinks cost an extra stat.
+        with os.scandir(path) as it:
+            if max_entries is None:
+                entries = list(it)
+            else:
+                entries = list(itertools.islice(it, max_entries + 1))
+                if len(entries) > max_entries:
+                    return None
+        is_sorted = len(entries) <= _LARGE_DIR_THRESHOLD
+        if is_sorted:
+            entries.sort(key=_sort_key)
+        (self._dir_cache if store is None else store)[path] = (mtime_ns, entries, is_sorted)
+        return entries
 
     def _populate_node(self, node: TreeNode[Path]):
         """Populate a tree node with directory contents"""
         if not node.data or not node.data.is_dir():
             return
+        self._populate_node_unchecked(node)
 
+    def _populate_node_unchecked(self, node: TreeNode[Path]):
+        """Populate a node already known to be a directory, skipping the is_dir() stat"""
+        # A stream still filling this node from its previous listing must not
+        # add stale entries after the new ones
+        self.workers.cancel_group(self, f"populate-{node.id}")
         try:
-            items = sorted(
-                node.data.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower())
-            )
-            for item in items:
-                node.add(
-                    f"📁 {item.name}" if item.is_dir() else f"📄 {item.name}",
-                    data=item,
-                    allow_expand=item.is_dir(),
-                )
+            entries = self._scan_dir(node.data)
+            hidden = 0
+            if len(entries) > _LARGE_DIR_THRESHOLD:
+                # Pick out just the first page instead of sorting everything
+                limit = self._visible_limits.get(node.data) or self._page_size()
+                # Remember what was shown so the next page starts right after it
+                self._visible_limits[node.data] = limit
+                hidden = max(len(entries) - limit, 0)
+                if self._dir_cache[node.data][2]:
+                    entries = entries[:limit]
+                else:
+                    entries = heapq.nsmallest(limit, entries, key=_sort_key)
+            # Add the first batch right away and stream the rest from a worker
+            # so huge directories don't freeze the UI
+            self._add_entries(node, entries[:_POPULATE_BATCH])
         except PermissionError:
             node.add("🚫 Permission Denied", allow_expand=False)
+            return
         except Exception:
             node.add("❌ Error", allow_expand=False)
+            return
+
+        if len(entries) > _POPULATE_BATCH:
+            self.run_worker(
+                self._add_remaining(node, entries[_POPULATE_BATCH:], hidden),
+                group=f"populate-{node.id}",
+                exclusive=True,
+            )
+        elif hidden:
+            self._add_more_node(node, hidden)
+
+    def _start_preload(self) -> None:
+        """Scan the folders below the root in a thread so expanding them is instant."""
+        self.run_worker(
+            partial(self._preload, self.root_path),
+            thread=True,
+            group="preload",
+            exclusive=True,
+        )
+
+    def _preload(self, root: Path) -> None:
+        """Fill the listing cache for the first _PRELOAD_DEPTH levels under root."""
+        worker = get_current_worker()
+        # Only the main thread touches the cache; hand the listings over at the end
+        listings: Dict[Path, Tuple[int, List[os.DirEntry], bool]] = {}
+        self._preload_listings(root, worker, listings)
+        if listings and not worker.is_cancelled:
+            self.app.call_from_thread(self._merge_preloaded, worker, listings)
+
+    def _preload_listings(self, root: Path, worker: Worker, listings: Dict) -> None:
+        """Scan breadth-first under root into listings until the budget runs out."""
+        budget = _PRELOAD_BUDGET
+        level = [root]
+        for _ in range(_PRELOAD_DEPTH + 1):
+            next_level = []
+            for path in level:
+                if worker.is_cancelled:
+                    return
+                try:
+                    entries = self._scan_dir(path, max_entries=budget, store=listings)
+                    if entries is None:
+                        # Pathologically big tree; leave the rest to on-demand scans
+                        return
+                    budget -= len(entries)
+                    # is_dir() may stat a symlink, which can fail too
+                    next_level.extend(Path(e.path) for e in entries if e.is_dir())
+                except OSError:
+                    continue
+            level = next_level
+
+    def _merge_preloaded(self, worker: Worker, listings: Dict) -> None:
+        """Add preloaded listings to the cache unless a reload made them stale."""
+        if worker.is_cancelled:
+            return
+        for path, listing in listings.items():
+            # Anything scanned on demand in the meantime is at least as fresh
+            self._dir_cache.setdefault(path, listing)
+
+    def _page_size(self) -> int:
+        """Number of entries to show per page of a large directory."""
+        return max(self.size.height * 2, _POPULATE_BATCH)
+
+    def _add_more_node(self, node: TreeNode[Path], hidden: int) -> None:
+        """Add the "… N more" leaf that loads the next page when selected."""
+        more = node.add_leaf(f"… {hidden} more")
+        self._more_nodes[more] = node
+
+    def _show_more(self, more: TreeNode[Path]) -> None:
+        """Replace a "… N more" node with the next page of its directory."""
+        node = self._more_nodes.pop(more, None)
+        if node is None:
+            # Already dropped by a repopulate earlier in the same pass
+            return
+        path = node.data
+        shown = self._visible_limits[path]
+        limit = shown + self._page_size()
+        self._visible_limits[path] = limit
+
+        cached = self._dir_cache.get(path)
+        try:
+            entries = self._scan_dir(path)
+        except OSError:
+            entries = None
+        if cached is None or entries is not cached[1]:
+            # The directory changed since the shown pages were picked; start over
+            self._unindex_children(node)
+            node.remove_children()
+            self._populate_node_unchecked(node)
+            return
+
+        if not cached[2]:
+            # Past the first page a single full sort beats repeated nsmallest
+            # calls over an ever larger prefix
+            entries = sorted(entries, key=_sort_key)
+            self._dir_cache[path] = (cached[0], entries, True)
+
+        more.remove()
+        self._add_entries(node, entries[shown:limit])
+        if len(entries) > limit:
+            self._add_more_node(node, len(entries) - limit)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Load the next page of a large directory as its end scrolls into view."""
+        super().watch_scroll_y(old_value, new_value)
+        # Look one screen ahead so the next page is there before it's needed
+        bottom = new_value + self.size.height * 2
+        for more, node in self._more_nodes.items():
+            # Nodes under a collapsed folder keep the line they last had
+            if self._is_shown(node) and 0 <= more.line <= bottom:
+                # Line numbers are stale once a page is added; the next
+                # scroll picks up any further page
+                self._show_more(more)
+                return
+
+    def _is_shown(self, node: TreeNode[Path]) -> bool:
+        """Whether a node's children are on screen, i.e. it and every ancestor are expanded."""
+        while node is not None:
+            if not node.is_expanded:
+                return False
+            node = node.parent
+        return True
+
+    def _add_entries(self, node: TreeNode[Path], entries: List[os.DirEntry]) -> None:
+        """Add a child node for each directory entry."""
+        for entry in entries:
+            is_dir = entry.is_dir()
+            path = Path(entry.path)
+            self._path_index[path] = node.add(
+                (_DIR_PREFIX if is_dir else _FILE_PREFIX) + entry.name,
+                data=path,
+                allow_expand=is_dir,
+            )
+
+    async def _add_remaining(
+        self, node: TreeNode[Path], entries: List[os.DirEntry], hidden: int
+    ) -> None:
+        """Add the rest of a large listing in batches, yielding between them."""
+        for start in range(0, len(entries), _POPULATE_BATCH):
+            await asyncio.sleep(0)
+            if not self._is_attached(node):
+                # An ancestor was refreshed or removed while we were streaming
+                return
+            self._add_entries(node, entries[start:start + _POPULATE_BATCH])
+        if hidden:
+            self._add_more_node(node, hidden)
+
+    def _is_attached(self, node: TreeNode[Path]) -> bool:
+        """Whether a node is still part of the tree rather than removed or cleared."""
+        try:
+            return self.get_node_by_id(node.id) is node
+        except UnknownNodeID:
+            return False
 
     def on_mount(self) -> None:
         """When the tree is mounted, populate the root."""
         self._populate_node(self.root)
         self.root.expand()
+        self._start_preload()
 
     def on_tree_node_expanded(self, event: Tree.NodeExpanded[Path]) -> None:
         """Handle node expansion - load children from disk."""
         # Clear existing children before populating
+        self._unindex_children(event.node)
         event.node.remove_children()
-        self._populate_node(event.node)
+        self._populate_node_unchecked(event.node)
+
+    def on_tree_node_selected(self, event: Tree.NodeSelected[Path]) -> None:
+        """Load the next page when a "… N more" node is selected."""
+        if event.node in self._more_nodes:
+            event.stop()
+            self._show_more(event.node)
 
 
 class UtilityPanel(Container):
@@ -93,16 +392,20 @@ class UtilityPanel(Container):
         self._input_widget: Optional[Input] = None
         self._pending_action: Optional[str] = None
         self._action_index = 0
+        self._content = Container(id="utility-content")
+        self._label_widgets: List[Label] = []
+        self._status_label: Optional[Label] = None
 
     def compose(self) -> ComposeResult:
-        yield Container(id="utility-content")
+        yield self._content
 
-    def show_actions_for(self, path: Optional[Path]) -> None:
+    def show_actions_for(self, path: Optional[Path], is_dir: bool) -> None:
         """Show context-specific actions for the selected item."""
         self._selected_path = path
         self._current_actions = []
+        self._action_index = 0
         if path:
-            if path.is_dir():
+            if is_dir:
                 self._current_actions = ["New File", "New Folder", "Rename", "Delete"]
             else:
                 self._current_actions = ["Rename", "Delete"]
@@ -110,21 +413,35 @@ class UtilityPanel(Container):
 
     def _render_actions(self) -> None:
         """Render the action labels and ensure the panel has focus."""
-        container = self.query_one("#utility-content", Container)
-        container.remove_children()
+        self._content.remove_children()
         self._input_widget = None
-        for i, action in enumerate(self._current_actions):
-            label = Label(f"▸ {action}" if i == self._action_index else f"  {action}")
-            container.mount(label)
+        self._label_widgets = [
+            Label(f"▸ {action}" if i == self._action_index else f"  {action}")
+            for i, action in enumerate(self._current_actions)
+        ]
 
-        if self._current_actions:
+        if self._label_widgets:
+            self._content.mount(*self._label_widgets)
             self.focus()
 
+    def _move_action_index(self, step: int) -> None:
+        """Move the caret, updating only the two labels that change."""
+        old = self._action_index
+        new = (old + step) % len(self._current_actions)
+        self._action_index = new
+        self._label_widgets[old].update(f"  {self._current_actions[old]}")
+        self._label_widgets[new].update(f"▸ {self._current_actions[new]}")
+
     def clear_panel(self) -> None:
         """Clear the panel and reset state."""
-        self.query_one("#utility-content", Container).remove_children()
+        if not self._label_widgets and self._input_widget is None and self._selected_path is None:
+            # Nothing shown, so skip the DOM removal
+            return
+        self._content.remove_children()
         self._selected_path = None
         self._current_actions = []
+        self._label_widgets = []
+        self._status_label = None
         self._input_widget = None
         self._pending_action = None
         self._action_index = 0
@@ -132,24 +449,37 @@ class UtilityPanel(Container):
     def show_input_prompt(self, prompt: str, action: str) -> None:
         """Display an input field for an action."""
         self._pending_action = action
-        container = self.query_one("#utility-content", Container)
-        container.remove_children()
+        self._content.remove_children()
+        self._label_widgets = []
         self._input_widget = Input(placeholder=prompt)
-        container.mount(self._input_widget)
+        self._content.mount(self._input_widget)
         self._input_widget.focus()
 
+    def is_showing(self, path: Path) -> bool:
+        """Whether the panel is still open for the given path."""
+        return self._selected_path == path
+
+    def set_busy(self, busy: bool) -> None:
+        """Show or hide a working indicator while a file operation runs."""
+        if busy:
+            if self._status_label is not None:
+                return
+            self._status_label = Label("⏳ Working…")
+            self._content.mount(self._status_label)
+        elif self._status_label is not None:
+            self._status_label.remove()
+            self._status_label = None
+
     def on_key(self, event: Key) -> None:
         """Handle key presses for navigating actions."""
         if self._input_widget or not self._current_actions:
             return
 
         if event.key == "up":
-            self._action_index = (self._action_index - 1) % len(self._current_actions)
-            self._render_actions()
+            self._move_action_index(-1)
             event.stop()
         elif event.key == "down":
-            self._action_index = (self._action_index + 1) % len(self._current_actions)
-            self._render_actions()
+            self._move_action_index(1)
             event.stop()
         elif event.key == "enter":
             action = self._current_actions[self._action_index]
@@ -172,6 +502,14 @@ class SamplePyTUI(App):
 
     CSS_PATH = "main.css"
 
+    class FileOpDone(Message):
+        """Message posted from the worker thread when a file operation finishes."""
+        def __init__(self, action: str, path: Path, success: bool) -> None:
+            self.action = action
+            self.path = path
+            self.success = success
+            super().__init__()
+
     BINDINGS = [
         Binding("q", "quit", "Quit"),
         Binding("r", "refresh_tree", "Refresh"),
@@ -183,26 +521,69 @@ class SamplePyTUI(App):
         super().__init__()
         self.current_path = Path.cwd()
         self.path_history: List[Path] = []
+        self._reload_timer: Optional[Timer] = None
+        # Target of the file operation in flight, so only one runs at a time
+        self._file_op_path: Optional[Path] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
+        # Keep references so handlers don't run a DOM query on every keypress
+        self._tree = FileTree(self.current_path, id="file-tree")
+        self._utility_panel = UtilityPanel(id="utility-panel")
         yield Container(
-            FileTree(self.current_path, id="file-tree"),
-            UtilityPanel(id="utility-panel"),
+            self._tree,
+            self._utility_panel,
             id="main-container"
         )
 
     def _get_tree(self) -> FileTree:
         """Helper to get the file tree widget."""
-        return self.query_one(FileTree)
+        return self._tree
 
     def _get_utility_panel(self) -> UtilityPanel:
         """Helper to get the utility panel widget."""
-        return self.query_one(UtilityPanel)
+        return self._utility_panel
+
+    def _schedule_reload(self) -> None:
+        """Reload the tree after a short delay so bursts of refreshes rescan once."""
+        if self._reload_timer:
+            self._reload_timer.stop()
+        self._reload_timer = self.set_timer(0.016, self._do_reload)
+
+    def _do_reload(self) -> None:
+        self._reload_timer = None
+        # An explicit refresh must not trust the mtime cache
+        self._get_tree().reload(rescan=True)
+
+    def _run_file_op(self, action: str, path: Path, func: Callable[..., bool], *args) -> None:
+        """Run a blocking FileUtils call in a worker thread.
+
+        The result comes back as a FileOpDone message, so the app keeps
+        handling keys and bindings while the operation runs.
+        """
+        if self._file_op_path is not None:
+            # Still waiting on the previous one
+            self.bell()
+            return
+        self._file_op_path = path
+        self._get_utility_panel().set_busy(True)
+        self.run_worker(
+            partial(self._file_op_worker, action, path, func, *args),
+            thread=True,
+            group="file-op",
+        )
+
+    def _file_op_worker(self, action: str, path: Path, func: Callable[..., bool], *args) -> None:
+        self.post_message(self.FileOpDone(action, path, func(*args)))
+
+    def _close_panel(self) -> None:
+        """Clear the utility panel and hand focus back to the tree."""
+        self._get_utility_panel().clear_panel()
+        self._get_tree().focus()
 
     def _refresh_ui(self, focus_tree: bool = True) -> None:
         """Refreshes the UI by reloading the tree and clearing the panel."""
-        self._get_tree().reload()
+        self._schedule_reload()
         self._get_utility_panel().clear_panel()
         if focus_tree:
             self._get_tree().focus()
@@ -224,15 +605,17 @@ class SamplePyTUI(App):
 
     def action_show_actions(self) -> None:
         tree = self._get_tree()
-        if tree.cursor_node and tree.cursor_node.data:
-            self._get_utility_panel().show_actions_for(tree.cursor_node.data)
+        node = tree.cursor_node
+        if node and node.data:
+            # Nodes are only expandable when they were directories at scan time
+            self._get_utility_panel().show_actions_for(node.data, node.allow_expand)
 
     # --- Event Handlers (@on decorator) ---
 
     @on(Tree.NodeSelected)
     def on_tree_node_selected(self, event: Tree.NodeSelected[Path]) -> None:
         path = event.node.data
-        if path and path.is_dir():
+        if path and event.node.allow_expand:
             self.path_history.append(self.current_path)
             self.current_path = path
             self.sub_title = str(self.current_path)
@@ -246,8 +629,7 @@ class SamplePyTUI(App):
         utility_panel = self._get_utility_panel()
         
         if message.action == "clear_and_focus_tree":
-            utility_panel.clear_panel()
-            self._get_tree().focus()
+            self._close_panel()
             return
             
         action_prompts = {
@@ -259,11 +641,13 @@ class SamplePyTUI(App):
         if message.action in action_prompts:
             utility_panel.show_input_prompt(action_prompts[message.action], message.action)
         elif message.action == "Delete":
-            success = FileUtils.delete_path(message.path)
-            if success:
-                self._refresh_ui()
+            if FileUtils.is_nonempty_dir(message.path):
+                utility_panel.show_input_prompt(
+                    f"Delete '{message.path.name}' and everything in it? Type yes to confirm",
+                    "Confirm Delete",
+                )
             else:
-                self.bell()
+                self._run_file_op(message.action, message.path, FileUtils.delete_path, message.path)
 
     @on(UtilityPanel.InputMessage)
     async def handle_utility_input(self, message: UtilityPanel.InputMessage) -> None:
@@ -271,32 +655,61 @@ class SamplePyTUI(App):
         new_name = message.value
 
         if message.action == "New File":
-            success = FileUtils.create_file(path / new_name)
+            self._run_file_op(
+                message.action, path, FileUtils.create_file, os.path.join(path, new_name)
+            )
         elif message.action == "New Folder":
-            success = FileUtils.create_folder(path / new_name)
+            self._run_file_op(
+                message.action, path, FileUtils.create_folder, os.path.join(path, new_name)
+            )
         elif message.action == "Rename":
-            success = FileUtils.rename_path(path, path.with_name(new_name))
-        else:
+            self._run_file_op(
+                message.action, path,
+                FileUtils.rename_path, path, os.path.join(path.parent, new_name)
+            )
+        elif message.action == "Confirm Delete":
+            if new_name.strip().lower() in ("y", "yes"):
+                self._run_file_op("Delete", path, FileUtils.delete_path, path)
+            else:
+                self._close_panel()
+
+    @on(FileOpDone)
+    def handle_file_op_done(self, message: FileOpDone) -> None:
+        """Patch the tree once a file operation has finished."""
+        self._file_op_path = None
+        utility_panel = self._get_utility_panel()
+        utility_panel.set_busy(False)
+        tree = self._get_tree()
+        if not message.success:
+            self.bell()
+            if message.action == "Delete":
+                # rmtree may have removed part of the folder before failing
+                tree.refresh_dir(message.path.parent)
             return
 
-        if success:
-            self._refresh_ui()
+        if message.action == "Delete":
+            tree.remove_path(message.path)
+        elif message.action == "Rename":
+            tree.refresh_dir(message.path.parent)
         else:
-            self.bell()
+            tree.refresh_dir(message.path)
+        if utility_panel.is_showing(message.path):
+            # Leave alone a panel the user opened for something else meanwhile
+            self._close_panel()
 
     def _create_file(self, dir_path: Path, name: str):
-        new_path = dir_path / name
+        new_path = os.path.join(dir_path, name)
         return FileUtils.create_file(new_path)
 
     def _create_folder(self, dir_path: Path, name: str):
-        new_path = dir_path / name
+        new_path = os.path.join(dir_path, name)
         return FileUtils.create_folder(new_path)
 
     def _delete_path(self, path: Path):
         return FileUtils.delete_path(path)
 
     def _rename_path(self, path: Path, new_name: str):
-        new_path = path.parent / new_name
+        new_path = os.path.join(path.parent, new_name)
         return FileUtils.rename_path(path, new_path)
 
 
@@ -4,8 +4,10 @@ Simple file operations without complex audio processing
 """
 
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
+from stat import S_ISDIR
 import os
+import shutil
 
 class FileUtils:
     """Basic file utilities"""
@@ -14,7 +16,8 @@ class FileUtils:
     def get_files_in_directory(directory: Path) -> List[Path]:
         """Get all files in a directory"""
         try:
-            return [f for f in directory.iterdir() if f.is_file()]
+            with os.scandir(directory) as it:
+                return [Path(e.path) for e in it if e.is_file()]
         except Exception:
             return []
     
@@ -22,7 +25,8 @@ class FileUtils:
     def get_directories_in_directory(directory: Path) -> List[Path]:
         """Get all directories in a directory"""
         try:
-            return [d for d in directory.iterdir() if d.is_dir()]
+            with os.scandir(directory) as it:
+                return [Path(e.path) for e in it if e.is_dir()]
         except Exception:
             return []
     
@@ -62,40 +66,52 @@ class FileUtils:
             return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
 
     @staticmethod
-    def create_file(path: Path) -> bool:
+    def create_file(path: Union[str, Path]) -> bool:
         """Create a new empty file at the given path. Returns True on success."""
         try:
-            path.touch(exist_ok=False)
+            open(path, "x").close()
             return True
         except Exception:
             return False
 
     @staticmethod
-    def create_folder(path: Path) -> bool:
+    def create_folder(path: Union[str, Path]) -> bool:
         """Create a new folder at the given path. Returns True on success."""
         try:
-            path.mkdir(parents=False, exist_ok=False)
+            os.mkdir(path)
             return True
         except Exception:
             return False
 
+    @staticmethod
+    def is_nonempty_dir(path: Path) -> bool:
+        """Return True if path is a real folder (not a symlink) with any contents"""
+        try:
+            if not S_ISDIR(os.lstat(path).st_mode):
+                return False
+            with os.scandir(path) as it:
+                return next(it, None) is not None
+        except Exception:
+            return False
+
     @staticmethod
     def delete_path(path: Path) -> bool:
-        """Delete a file or folder at the given path. Returns True on success."""
+        """Delete a file or folder (with its contents) at the given path. Returns True on success."""
         try:
-            if path.is_dir():
-                os.rmdir(path)
+            # lstat so a symlink to a folder removes the link, not the target
+            if S_ISDIR(os.lstat(path).st_mode):
+                shutil.rmtree(path)
             else:
-                path.unlink()
+                os.unlink(path)
             return True
         except Exception:
             return False
 
     @staticmethod
-    def rename_path(path: Path, new_path: Path) -> bool:
+    def rename_path(path: Union[str, Path], new_path: Union[str, Path]) -> bool:
         """Rename a file or folder to new_path. Returns True on success."""
         try:
-            path.rename(new_path)
+            os.rename(path, new_path)
             return True
         except Exception:
             return False 
\ No newline at end of file
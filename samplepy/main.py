@@ -3,10 +3,10 @@ SamplePy - Simple File Browser TUI
 Main entry point for the application
 """
 
-from .cli.tui_minimal import run_minimal_tui
-
 def main():
     """Main entry point that launches the TUI"""
+    from .cli.tui_minimal import run_minimal_tui
+
     run_minimal_tui()
 
 if __name__ == "__main__":